@@ -0,0 +1,72 @@
+# Deterministic dataset for the benchmark suite: the same seed and sizes always give the same documents, _ids included
+# Usage (from suite.py or load_test.py): documents = generate(seed=0, users=100, quizzes=1000, questions_per_quiz=20); load(db, documents)
+import random
+import struct
+from datetime import datetime, timedelta, timezone
+from bson.objectid import ObjectId
+
+words = ["svelte", "react", "store", "component", "prop", "event", "binding", "slot", "action", "transition", "server", "route",
+         "query", "index", "cursor", "cache", "worker", "thread", "socket", "header", "token", "schema", "array", "object"]
+base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+
+
+
+
+def make_id(rng, seconds):
+    # Like a real ObjectId, the first 4 bytes are the creation time, so _id order still follows creation order
+    return ObjectId(struct.pack(">I", int(base_time.timestamp()) + seconds) + rng.randbytes(8))
+
+
+
+
+
+
+def sentence(rng, length):
+    return " ".join(rng.choice(words) for _ in range(length))
+
+
+
+
+
+
+def generate(seed, users, quizzes, questions_per_quiz):
+    rng = random.Random(seed)
+    usernames = [f"user{i}" for i in range(users)]
+    documents = {"users": [], "quizzes": [], "questions": []}
+    for i, username in enumerate(usernames):
+        documents["users"].append({"_id": make_id(rng, i), "username": username, "email": f"{username}@example.com", "score_history": []})
+    for i in range(quizzes):
+        quiz_id = make_id(rng, 60 * i)
+        documents["quizzes"].append({
+            "_id": quiz_id,
+            "title": sentence(rng, 3).title(),
+            "description": sentence(rng, 12),
+            "creator_username": rng.choice(usernames),
+            "is_public": rng.random() < 0.8,
+            "date_created": (base_time + timedelta(minutes=i)).isoformat()
+        })
+        for j in range(questions_per_quiz):
+            correct_answer = sentence(rng, 2)
+            documents["questions"].append({
+                "_id": make_id(rng, 60 * i + j),
+                "quiz_id": str(quiz_id),
+                "question": f"{sentence(rng, 6)}?",
+                "answers": [correct_answer],
+                "correct_answer": correct_answer,
+                "explanation": sentence(rng, 10)
+            })
+    return documents
+
+
+
+
+
+
+def load(db, documents):
+    for collection_name in ["users", "quizzes", "questions", "attempts", "quiz_stats", "leaderboards", "counters"]:
+        db[collection_name].drop()
+    for collection_name, collection_documents in documents.items():
+        for start in range(0, len(collection_documents), 10000):
+            db[collection_name].insert_many(collection_documents[start:start + 10000])
@@ -0,0 +1,57 @@
+# Hammers one route of a running server with a fixed number of concurrent clients and reports throughput and latency
+# Usage: python benchmarks/http_load.py http://localhost:8000/get_public_quizzes --clients 16 --seconds 20
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+
+
+
+
+def client_loop(url, deadline, timings, errors):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30) # Kept alive between requests, like a browser
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 500:
+                errors.append(response.status)
+            if response.getheader("Connection", "").lower() == "close":
+                connection.close()
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(str(e))
+            connection.close()
+            continue
+        timings.append((time.perf_counter() - start) * 1000)
+    connection.close()
+
+
+
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("url")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=20)
+    args = parser.parse_args()
+    timings, errors = [], []
+    deadline = time.perf_counter() + args.seconds
+    threads = [threading.Thread(target=client_loop, args=(args.url, deadline, timings, errors)) for _ in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    timings.sort()
+    print(f"requests: {len(timings)}, errors: {len(errors)}, requests/s: {len(timings) / args.seconds:.1f}")
+    if timings:
+        print(f"p50: {statistics.median(timings):.2f} ms, p95: {timings[int(len(timings) * 0.95) - 1]:.2f} ms, p99: {timings[int(len(timings) * 0.99) - 1]:.2f} ms")
@@ -0,0 +1,80 @@
+# Times serializing a 10k-question /get_questions payload the old way (str() every _id, then the default JSON provider)
+# against BSONJSONProvider; no database is needed
+# Usage: python benchmarks/serialization.py --questions 10000 --runs 20
+import argparse
+import copy
+import os
+import statistics
+import sys
+import time
+from bson.objectid import ObjectId
+from flask.json.provider import DefaultJSONProvider
+
+os.environ.setdefault("ENSURE_INDEXES_ON_START", "0") # Importing the app shouldn't touch the database
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import app, orjson, BSONJSONProvider
+
+
+
+
+
+
+def make_questions(count):
+    quiz_id = str(ObjectId())
+    return [{
+        "_id": ObjectId(),
+        "quiz_id": quiz_id,
+        "question": f"What is term number {i}?",
+        "answers": [f"Definition {i}"],
+        "correct_answer": f"Definition {i}",
+        "explanation": "Because the definition says so."
+    } for i in range(count)]
+
+
+
+
+
+
+def old_way(questions):
+    for question in questions: # What the routes used to do before serializing
+        question["_id"] = str(question["_id"])
+    return DefaultJSONProvider(app).dumps({"success": True, "questions": questions})
+
+
+
+
+
+
+def new_way(questions):
+    return BSONJSONProvider(app).dumps({"success": True, "questions": questions})
+
+
+
+
+
+
+def measure(function, questions, runs):
+    timings = []
+    for _ in range(runs):
+        payload = copy.deepcopy(questions) # The old way converts in place
+        start = time.perf_counter()
+        function(payload)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), min(timings)
+
+
+
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    questions = make_questions(args.questions)
+    with app.app_context():
+        for function in [old_way, new_way]:
+            median, best = measure(function, questions, args.runs)
+            print(f"{function.__name__}: median {median:.2f} ms, best {best:.2f} ms")
+    print(f"orjson: {'yes' if orjson is not None else 'no (falls back to the json module)'}")
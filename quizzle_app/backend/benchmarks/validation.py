@@ -0,0 +1,131 @@
+# Times validating /grade and /sync_quiz bodies the old way (a fields dict per call, then try/except ObjectId() and loops in the route)
+# against the validators compiled from request_schemas; no database is needed
+# Usage: python benchmarks/validation.py --questions 20 --runs 100000
+import argparse
+import os
+import statistics
+import sys
+import time
+from bson.objectid import ObjectId
+
+os.environ.setdefault("ENSURE_INDEXES_ON_START", "0") # Importing the app shouldn't touch the database
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import request_validators
+
+
+
+
+
+
+def old_validate_request_object(request_object, request_object_fields):
+    if not isinstance(request_object, dict):
+        return "Request must be in JSON"
+    if len(request_object) != len(request_object_fields):
+        return f"Request needs {len(request_object_fields)} fields exactly"
+    for request_object_field, request_object_field_type in request_object_fields.items():
+        if request_object_field not in request_object:
+            return f"Request missing field '{request_object_field}'"
+        if not isinstance(request_object[request_object_field], request_object_field_type):
+            return f"Field '{request_object_field}' is supposed to be a {request_object_field_type.__name__}"
+    return ""
+
+
+
+
+
+
+def old_grade(request_object):
+    request_object_fields = {"quiz_id": str, "answers": dict}
+    if isinstance(request_object, dict) and "username" in request_object:
+        request_object_fields["username"] = str
+    message = old_validate_request_object(request_object, request_object_fields)
+    if message:
+        return message
+    try:
+        ObjectId(request_object.get("quiz_id"))
+    except Exception as _:
+        return "Field 'quiz_id' is invalid"
+    if not all(isinstance(answer, str) for answer in request_object.get("answers").values()):
+        return "Field 'answers' is invalid"
+    return ""
+
+
+
+
+
+
+def old_sync_quiz(request_object):
+    request_object_fields = {"title": str, "description": str, "is_public": bool, "questions": list, "_id": str}
+    message = old_validate_request_object(request_object, request_object_fields)
+    if message:
+        return message
+    try:
+        ObjectId(request_object.get("_id"))
+    except Exception as _:
+        return "Field '_id' is invalid"
+    question_content_fields = {"question": str, "answers": list, "correct_answer": str, "explanation": str}
+    for index, question in enumerate(request_object.get("questions")):
+        fields = {**question_content_fields, "_id": str} if isinstance(question, dict) and "_id" in question else question_content_fields
+        message = old_validate_request_object(question, fields)
+        if not message and "_id" in question:
+            try:
+                ObjectId(question["_id"])
+            except Exception as _:
+                message = "Field '_id' is invalid"
+        if message:
+            return f"Question {index}: {message}"
+    return ""
+
+
+
+
+
+
+def new_sync_quiz(request_object):
+    message = request_validators["sync_quiz"](request_object)
+    if message:
+        return message
+    for index, question in enumerate(request_object.get("questions")):
+        message = request_validators["question"](question)
+        if message:
+            return f"Question {index}: {message}"
+    return ""
+
+
+
+
+
+
+def measure(old, new, request_object, runs):
+    # Batches of the two take turns, so the machine speeding up or slowing down halfway doesn't favor either
+    timings = {old: [], new: []}
+    for _ in range(7):
+        for validate in [old, new]:
+            start = time.perf_counter()
+            for _ in range(runs):
+                assert not validate(request_object)
+            timings[validate].append((time.perf_counter() - start) / runs * 1000000)
+    return statistics.median(timings[old]), statistics.median(timings[new])
+
+
+
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=100000)
+    args = parser.parse_args()
+    questions = [{
+        "_id": str(ObjectId()),
+        "question": f"What is term number {i}?",
+        "answers": [f"Definition {i}", f"Definition {i + 1}", f"Definition {i + 2}"],
+        "correct_answer": f"Definition {i}",
+        "explanation": "Because the definition says so."
+    } for i in range(args.questions)]
+    grade_body = {"quiz_id": str(ObjectId()), "answers": {question["_id"]: question["correct_answer"] for question in questions}, "username": "tester"}
+    sync_body = {"title": "Terms", "description": "All the terms.", "is_public": True, "questions": questions, "_id": str(ObjectId())}
+    for name, old, new, body in [("/grade", old_grade, request_validators["grade"], grade_body), ("/sync_quiz", old_sync_quiz, new_sync_quiz, sync_body)]:
+        old_median, new_median = measure(old, new, body, args.runs)
+        print(f"{name} ({args.questions} questions): old median {old_median:.2f} µs, compiled median {new_median:.2f} µs ({(new_median - old_median) / old_median * 100:+.0f}%)")
@@ -1,7 +1,10 @@
 # Make a virtual environment with test_requirements.txt...start the MongoDB container before testing
 import os
+import gzip
+import json
 import pytest
-from backend.app import app
+from pymongo import ASCENDING
+from backend.app import app, db, _ensure_indexes, autocomplete_index, autocomplete_index_lock, MemoryCache, max_text_length
 
 # Useful resource: https://testdriven.io/blog/flask-pytest/
 
@@ -69,6 +72,29 @@ def test__validate_request_object(test_client):
 
 
 
+def test_request_validators(test_client):
+    requests = [ # Each fails on what's inside a field, which used to be checked by the route, or not at all
+        ("/add_question", {"quiz_id": "6569f84b0c8b0f15c7a4f8b3", "question": "Who?", "answers": ["Yes", 1], "correct_answer": "Yes", "explanation": ""}, "Field 'answers' is invalid"),
+        ("/add_question", {"quiz_id": "6569f84b0c8b0f15c7a4f8bz", "question": "Who?", "answers": ["Yes"], "correct_answer": "Yes", "explanation": ""}, "Field 'quiz_id' is invalid"),
+        ("/create_quiz", {"title": "T" * (max_text_length + 1), "description": "", "creator_username": "tester", "is_public": True}, f"Field 'title' can't be longer than {max_text_length} characters"),
+        ("/add_user", {"username": "tester", "email": "tester@example.com", "score_history": [{"quiz_name": "Svelte Trivia", "score": "90", "date_taken": ""}]}, "Field 'score_history' is invalid"),
+        ("/add_user", {"username": "tester", "email": "tester@example.com", "score_history": [{"quiz_name": "Svelte Trivia", "score": 90}]}, "Field 'score_history' is invalid"),
+        ("/grade", {"quiz_id": "6569f84b0c8b0f15c7a4f8b3", "answers": {}, "username": 1}, "Field 'username' is supposed to be a str"),
+        ("/grade", {"quiz_id": "6569f84b0c8b0f15c7a4f8b3", "answers": {}, "user": "tester"}, "Request needs 2 fields exactly"),
+        ("/grade", {"quiz_id": "6569f84b0c8b0f15c7a4f8b3", "answers": {}, "username": "tester", "user": "tester"}, "Request needs 3 fields exactly")
+    ]
+    for route, request_object, expected_message in requests:
+        response = test_client.post(route, json=request_object)
+        assert response.status_code == 400
+        response_object = response.get_json()
+        assert response_object["success"] == False
+        assert response_object.get("message") == expected_message
+
+
+
+
+
+
 def test_create_quiz(test_client):
     response = test_client.post("/create_quiz", json={
         "title": "Testing",
@@ -194,10 +220,12 @@ def test_get_user_quizzes(test_client):
         "creator_username": "tester"
     })
     response_object = response.get_json()
-    assert len(response_object) == 3
+    assert len(response_object) == 4
     assert response_object.get("success") == True
     assert len(response_object.get("public_quizzes")) == 1
+    assert len(response_object.get("public_quizzes")[0]) == 5
     assert len(response_object.get("private_quizzes")) == 0
+    assert response_object.get("next_cursor") == None
     
     # Cleanup
     _ = test_client.post("/delete_quiz", json={
@@ -219,9 +247,11 @@ def test_get_public_quizzes(test_client):
     _id = response.get_json().get("quiz").get("_id")
     response = test_client.get("/get_public_quizzes")
     response_object = response.get_json()
-    assert len(response_object) == 2
+    assert len(response_object) == 3
     assert response_object.get("success") == True
     assert len(response_object.get("public_quizzes")) == 1
+    assert len(response_object.get("public_quizzes")[0]) == 4
+    assert response_object.get("next_cursor") == None
     
     # Cleanup
     _ = test_client.post("/delete_quiz", json={
@@ -233,6 +263,130 @@ def test_get_public_quizzes(test_client):
 
 
 
+def test_quiz_pagination(test_client):
+    _ids = []
+    for is_public in [True, False, True]:
+        response = test_client.post("/create_quiz", json={
+            "title": "Testing",
+            "description": "Testing is important.",
+            "creator_username": "tester",
+            "is_public": is_public
+        })
+        _ids.append(response.get_json().get("quiz").get("_id"))
+
+    response = test_client.post("/get_user_quizzes?limit=2", json={
+        "creator_username": "tester"
+    })
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert [quiz.get("_id") for quiz in response_object.get("public_quizzes")] == [_ids[2]]
+    assert [quiz.get("_id") for quiz in response_object.get("private_quizzes")] == [_ids[1]]
+    assert response_object.get("next_cursor") == _ids[1]
+
+    response = test_client.post(f"/get_user_quizzes?limit=2&after={_ids[1]}", json={
+        "creator_username": "tester"
+    })
+    response_object = response.get_json()
+    assert [quiz.get("_id") for quiz in response_object.get("public_quizzes")] == [_ids[0]]
+    assert response_object.get("private_quizzes") == []
+    assert response_object.get("next_cursor") == None
+
+    response = test_client.get("/get_public_quizzes?limit=1")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert [quiz.get("_id") for quiz in response_object.get("public_quizzes")] == [_ids[2]]
+    assert response_object.get("next_cursor") == _ids[2]
+
+    response = test_client.get(f"/get_public_quizzes?limit=1&after={_ids[2]}")
+    response_object = response.get_json()
+    assert [quiz.get("_id") for quiz in response_object.get("public_quizzes")] == [_ids[0]]
+    assert response_object.get("next_cursor") == None
+
+    response = test_client.get("/get_public_quizzes?limit=0")
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Parameter 'limit' must be between 1 and 100"
+
+    response = test_client.get("/get_public_quizzes?after=nope")
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert response_object.get("message") == "Parameter 'after' is invalid"
+
+    # Cleanup
+    for _id in _ids:
+        _ = test_client.post("/delete_quiz", json={
+            "_id": _id
+        })
+
+
+
+
+
+
+def test_get_quiz_bundle(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    for answer in ["Yes", "No"]:
+        _ = test_client.post("/add_question", json={
+            "quiz_id": quiz.get("_id"),
+            "question": "Who?",
+            "answers": [answer],
+            "correct_answer": answer,
+            "explanation": f"{answer} is the right answer."
+        })
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 3
+    assert response_object.get("success") == True
+    assert response_object.get("quiz") == quiz
+    questions = response_object.get("questions")
+    assert [question.get("correct_answer") for question in questions] == ["No", "Yes"]
+    assert len(questions[0]) == 6
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}?fields=title&question_fields=question,correct_answer")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert response_object.get("quiz") == {"_id": quiz.get("_id"), "title": "Testing"}
+    assert response_object.get("questions")[0].keys() == {"_id", "question", "correct_answer"}
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}?fields=password")
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Parameter 'fields' has unknown field 'password'"
+
+    response = test_client.get("/quiz/nope")
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert response_object.get("message") == "Parameter 'quiz_id' is invalid"
+
+    response = test_client.get("/quiz/6569f84b0c8b0f15c7a4f8b3")
+    assert response.status_code == 404
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Record not found"
+
+    # Cleanup (implicit testing also with questions getting automatically deleted)
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
 def test_add_question(test_client):
     response = test_client.post("/create_quiz", json={
         "title": "Testing",
@@ -392,6 +546,26 @@ def test_delete_question(test_client):
     assert response_object.get("success") == False
     assert response_object.get("message") == "Record not found"
 
+    _ = test_client.post("/add_question", json={
+        "quiz_id": quiz.get("_id"),
+        "question": "Who?",
+        "answers": ["Yes"],
+        "correct_answer": "Yes",
+        "explanation": "Yes is the right answer."
+    })
+    response = test_client.delete(f"/delete_quiz_questions/{quiz.get('_id')}")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert response_object.get("success") == True
+    assert response_object.get("deleted_count") == 1
+
+    response = test_client.delete("/delete_quiz_questions/not-an-id")
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Parameter 'quiz_id' is invalid"
+
     # Cleanup (implicit testing also with questions getting automatically deleted)
     _ = test_client.post("/delete_quiz", json={
         "_id": quiz.get("_id")
@@ -402,7 +576,7 @@ def test_delete_question(test_client):
 
 
 
-def test_get_questions(test_client):
+def test_bulk_questions(test_client):
     response = test_client.post("/create_quiz", json={
         "title": "Testing",
         "description": "Testing is important.",
@@ -417,33 +591,86 @@ def test_get_questions(test_client):
         "correct_answer": "Yes",
         "explanation": "Yes is the right answer."
     })
-    
-    response = test_client.post("/get_questions", json={
-        "quiz_id": quiz.get("_id")
+    question = response.get_json().get("question")
+    response = test_client.post("/add_question", json={
+        "quiz_id": quiz.get("_id"),
+        "question": "What?",
+        "answers": ["No"],
+        "correct_answer": "No",
+        "explanation": "No is the right answer."
+    })
+    deleted_question = response.get_json().get("question")
+
+    response = test_client.post("/questions/bulk", json={
+        "quiz_id": quiz.get("_id"),
+        "upserts": [
+            {"question": "When?", "answers": ["Now"], "correct_answer": "Now", "explanation": ""},
+            {"question": "Who?", "answers": ["Yes"], "correct_answer": "Yes", "explanation": "Yes is the answer!!!", "_id": question.get("_id")},
+            {"question": "Where?", "answers": ["Here"], "correct_answer": "Here", "explanation": "", "_id": "6569f84b0c8b0f15c7a4f8b3"}
+        ],
+        "deletes": [deleted_question.get("_id")]
     })
     assert response.status_code == 200
     response_object = response.get_json()
-    assert len(response_object) == 2
+    assert len(response_object) == 3
     assert response_object.get("success") == True
-    assert len(response_object.get("questions")) == 1
+    upserts = response_object.get("upserts")
+    assert upserts[0].get("success") == True
+    assert isinstance(upserts[0].get("_id"), str)
+    assert upserts[1] == {"success": True, "_id": question.get("_id")}
+    assert upserts[2].get("success") == False
+    assert upserts[2].get("message") == "Record not found"
+    assert response_object.get("deletes") == [{"success": True, "_id": deleted_question.get("_id")}]
 
     response = test_client.post("/get_questions", json={
-        "quiz_id": ""
+        "quiz_id": quiz.get("_id")
+    })
+    questions = {question.get("_id"): question for question in response.get_json().get("questions")}
+    assert len(questions) == 2
+    assert questions[question.get("_id")].get("explanation") == "Yes is the answer!!!"
+    assert questions[upserts[0].get("_id")].get("question") == "When?"
+
+    response = test_client.post("/questions/bulk", json={
+        "quiz_id": quiz.get("_id"),
+        "upserts": [
+            {"question": "When?", "answers": ["Now"], "correct_answer": "Now", "explanation": ""},
+            {"question": "When?", "answers": "Now", "correct_answer": "Now", "explanation": ""}
+        ],
+        "deletes": [""]
     })
     assert response.status_code == 400
     response_object = response.get_json()
-    assert len(response_object) == 2
     assert response_object.get("success") == False
-    assert response_object.get("message") == "Field 'quiz_id' is invalid"
+    assert response_object.get("message") == "Batch has invalid items"
+    assert response_object.get("upserts")[0].get("success") == True
+    assert response_object.get("upserts")[1].get("message") == "Field 'answers' is supposed to be a list"
+    assert response_object.get("deletes")[0].get("message") == "Field '_id' is invalid"
 
+    response = test_client.post("/questions/bulk", json={
+        "quiz_id": quiz.get("_id"),
+        "upserts": [{"question": "Who?", "answers": ["Yes"], "correct_answer": "Yes", "explanation": "Changed", "_id": question.get("_id")}],
+        "deletes": [question.get("_id"), question.get("_id")]
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert response_object.get("message") == "Batch has invalid items"
+    assert response_object.get("upserts")[0].get("success") == True
+    assert [result.get("message") for result in response_object.get("deletes")] == ["Field '_id' is repeated", "Field '_id' is repeated"]
     response = test_client.post("/get_questions", json={
-        "quiz_id": "6569f84b0c8b0f15c7a4f8b3"
+        "quiz_id": quiz.get("_id")
     })
-    assert response.status_code == 200
+    assert len(response.get_json().get("questions")) == 2
+
+    response = test_client.post("/questions/bulk", json={
+        "quiz_id": "6569f84b0c8b0f15c7a4f8b3",
+        "upserts": [],
+        "deletes": []
+    })
+    assert response.status_code == 404
     response_object = response.get_json()
     assert len(response_object) == 2
-    assert response_object.get("success") == True
-    assert len(response_object.get("questions")) == 0
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field 'quiz_id' doesn't exist"
 
     # Cleanup (implicit testing also with questions getting automatically deleted)
     _ = test_client.post("/delete_quiz", json={
@@ -455,80 +682,129 @@ def test_get_questions(test_client):
 
 
 
-def test_add_user(test_client):
-    response = test_client.post("/add_user", json={
-        "username": "tester",
-        "email": "tester@gmail.com",
-        "score_history": []
+def test_sync_quiz(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
     })
-    assert response.status_code == 201
+    quiz = response.get_json().get("quiz")
+    questions = []
+    for answer in ["Yes", "No", "Maybe"]:
+        response = test_client.post("/add_question", json={
+            "quiz_id": quiz.get("_id"),
+            "question": "Who?",
+            "answers": [answer],
+            "correct_answer": answer,
+            "explanation": ""
+        })
+        questions.append(response.get_json().get("question"))
+
+    response = test_client.post("/sync_quiz", json={
+        "title": "Testing again",
+        "description": "Testing is important.",
+        "is_public": False,
+        "questions": [
+            {field: questions[0].get(field) for field in ["question", "answers", "correct_answer", "explanation", "_id"]}, # Unchanged
+            {"question": "Who?", "answers": ["No!"], "correct_answer": "No!", "explanation": "", "_id": questions[1].get("_id")}, # Updated
+            {"question": "Who?", "answers": ["Maybe"], "correct_answer": "Maybe", "explanation": ""}, # Same as the third one, so it's kept
+            {"question": "When?", "answers": ["Now"], "correct_answer": "Now", "explanation": ""} # Inserted
+        ],
+        "_id": quiz.get("_id")
+    })
+    assert response.status_code == 200
     response_object = response.get_json()
-    assert len(response_object) == 2
     assert response_object.get("success") == True
-    user = response_object.get("user")
-    assert len(user) == 4
-    assert user.get("username") == "tester"
-    assert user.get("email") == "tester@gmail.com"
-    assert user.get("score_history") == []
-    assert isinstance(user.get("_id"), str)
-
-    response = test_client.post("/add_user", json={
-        "username": "tester",
-        "email": "tester@gmail.com",
-        "score_history": []
+    assert response_object.get("unchanged") == 2
+    assert response_object.get("updated") == 1
+    assert response_object.get("inserted") == 1
+    assert response_object.get("deleted") == 0
+    question_ids = response_object.get("question_ids")
+    assert question_ids[:3] == [question.get("_id") for question in questions]
+
+    response = test_client.post("/sync_quiz", json={
+        "title": "Testing again",
+        "description": "Testing is important.",
+        "is_public": False,
+        "questions": [{"question": "When?", "answers": ["Now"], "correct_answer": "Now", "explanation": "", "_id": question_ids[3]}],
+        "_id": quiz.get("_id")
     })
-    assert response.status_code == 400
     response_object = response.get_json()
-    assert len(response_object) == 2
-    assert response_object.get("success") == False
-    assert response_object.get("message") == "Field 'username' already exists"
-
-    # Cleanup
-    _ = test_client.post("/delete_user", json={
-        "_id": user.get("_id")
+    assert response_object.get("unchanged") == 1
+    assert response_object.get("deleted") == 3
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
     })
+    assert [question.get("_id") for question in response.get_json().get("questions")] == [question_ids[3]]
 
-
-
-
-
-
-def test_update_user(test_client):
-    response = test_client.post("/add_user", json={
-        "username": "tester",
-        "email": "tester@gmail.com",
-        "score_history": []
+    response = test_client.post("/sync_quiz", json={
+        "title": "Testing again",
+        "description": "Testing is important.",
+        "is_public": False,
+        "questions": [{"question": "When?", "answers": "Now", "correct_answer": "Now", "explanation": ""}],
+        "_id": quiz.get("_id")
     })
-    user = response.get_json().get("user")
-    _id = user.get("_id")
-    
-    user["score_history"] = [{"quiz_name": "Svelte Trivia", "score": 90, "date_taken": ""}] # Leaving the last one blank out of laziness
-    response = test_client.post("/update_user", json=user)
-    assert response.status_code == 200
+    assert response.status_code == 400
     response_object = response.get_json()
     assert len(response_object) == 2
-    assert response_object.get("success") == True
-    assert response_object.get("message") == "Successful update"
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Question 0: Field 'answers' is supposed to be a list"
 
-    user["_id"] = ""
-    response = test_client.post("/update_user", json=user)
+    response = test_client.post("/sync_quiz", json={
+        "title": "Testing again",
+        "description": "Testing is important.",
+        "is_public": False,
+        "questions": [
+            {"question": "Why?", "answers": ["Because"], "correct_answer": "Because", "explanation": "", "_id": question_ids[3]},
+            {"question": "How?", "answers": ["Like this"], "correct_answer": "Like this", "explanation": "", "_id": question_ids[3]}
+        ],
+        "_id": quiz.get("_id")
+    })
     assert response.status_code == 400
     response_object = response.get_json()
     assert len(response_object) == 2
     assert response_object.get("success") == False
-    assert response_object.get("message") == "Field '_id' is invalid"
+    assert response_object.get("message") == "Question 1: Field '_id' is repeated"
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    })
+    assert [question.get("_id") for question in response.get_json().get("questions")] == [question_ids[3]]
 
-    user["_id"] = "6569f84b0c8b0f15c7a4f8b3"
-    response = test_client.post("/update_user", json=user)
+    response = test_client.post("/sync_quiz", json={
+        "title": "Testing again",
+        "description": "Testing is important.",
+        "is_public": False,
+        "questions": [{"question": f"Question {i}?", "answers": ["Yes"], "correct_answer": "Yes", "explanation": ""} for i in range(3)],
+        "_id": quiz.get("_id")
+    })
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert response_object.get("inserted") == 3
+    assert response_object.get("deleted") == 1
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    })
+    questions = response.get_json().get("questions")
+    assert [question.get("_id") for question in questions] == response_object.get("question_ids")
+    assert [question.get("question") for question in questions] == ["Question 0?", "Question 1?", "Question 2?"]
+
+    response = test_client.post("/sync_quiz", json={
+        "title": "Testing again",
+        "description": "Testing is important.",
+        "is_public": False,
+        "questions": [],
+        "_id": "6569f84b0c8b0f15c7a4f8b3"
+    })
     assert response.status_code == 404
     response_object = response.get_json()
     assert len(response_object) == 2
     assert response_object.get("success") == False
     assert response_object.get("message") == "Record not found"
 
-    # Cleanup
-    _ = test_client.post("/delete_user", json={
-        "_id": _id
+    # Cleanup (implicit testing also with questions getting automatically deleted)
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
     })
 
 
@@ -536,34 +812,610 @@ def test_update_user(test_client):
 
 
 
-def test_delete_user(test_client):
-    response = test_client.post("/add_user", json={
-        "username": "tester",
-        "email": "tester@gmail.com",
-        "score_history": []
+def test_get_questions(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
     })
-    user = response.get_json().get("user")
-
-    response = test_client.post("/delete_user", json={
-        "_id": user.get("_id")
+    quiz = response.get_json().get("quiz")
+    response = test_client.post("/add_question", json={
+        "quiz_id": quiz.get("_id"),
+        "question": "Who?",
+        "answers": ["Yes"],
+        "correct_answer": "Yes",
+        "explanation": "Yes is the right answer."
+    })
+    
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
     })
     assert response.status_code == 200
     response_object = response.get_json()
     assert len(response_object) == 2
     assert response_object.get("success") == True
-    assert response_object.get("message") == "Successful delete"
+    assert len(response_object.get("questions")) == 1
 
-    response = test_client.post("/delete_user", json={
-        "_id": ""
+    response = test_client.post("/get_questions", json={
+        "quiz_id": ""
     })
     assert response.status_code == 400
     response_object = response.get_json()
     assert len(response_object) == 2
     assert response_object.get("success") == False
-    assert response_object.get("message") == "Field '_id' is invalid"
+    assert response_object.get("message") == "Field 'quiz_id' is invalid"
 
-    response = test_client.post("/delete_user", json={
-        "_id": "6569f84b0c8b0f15c7a4f8b3"
+    response = test_client.post("/get_questions", json={
+        "quiz_id": "6569f84b0c8b0f15c7a4f8b3"
+    })
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert len(response_object.get("questions")) == 0
+
+    # Cleanup (implicit testing also with questions getting automatically deleted)
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_get_quiz_options(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    for answer in ["Yes", "No"]:
+        _ = test_client.post("/add_question", json={
+            "quiz_id": quiz.get("_id"),
+            "question": "Who?",
+            "answers": [answer],
+            "correct_answer": answer,
+            "explanation": f"{answer} is the right answer."
+        })
+
+    response = test_client.post("/get_quiz_options", json={
+        "quiz_id": quiz.get("_id"),
+        "answers_per_question": 2
+    })
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    questions = response_object.get("questions")
+    assert len(questions) == 2
+    for question in questions:
+        assert question.keys() == {"_id", "question", "options"} # Answers are only revealed by /grade
+        assert 1 <= len(question.get("options")) <= 2
+        assert len(set(question.get("options"))) == len(question.get("options"))
+
+    response = test_client.post("/get_quiz_options", json={
+        "quiz_id": "",
+        "answers_per_question": 2
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field 'quiz_id' is invalid"
+
+    response = test_client.post("/get_quiz_options", json={
+        "quiz_id": quiz.get("_id"),
+        "answers_per_question": 0
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field 'answers_per_question' must be between 1 and 10"
+
+    # Cleanup (implicit testing also with questions getting automatically deleted)
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_etags(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    response = test_client.post("/add_question", json={
+        "quiz_id": quiz.get("_id"),
+        "question": "Who?",
+        "answers": ["Yes"],
+        "correct_answer": "Yes",
+        "explanation": "Yes is the right answer."
+    })
+    question = response.get_json().get("question")
+
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    })
+    etag = response.headers.get("ETag")
+    assert etag
+    response = test_client.get(f"/get_questions?quiz_id={quiz.get('_id')}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers.get("ETag") == etag
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    }, headers={"If-None-Match": etag})
+    assert response.status_code == 412 # Only GET and HEAD get a 304
+    response = test_client.get("/get_questions?quiz_id=nope")
+    assert response.status_code == 400
+    assert response.get_json().get("message") == "Field 'quiz_id' is invalid"
+
+    question["explanation"] = "Yes is the answer!!!"
+    _ = test_client.post("/update_question", json=question)
+    response = test_client.get(f"/get_questions?quiz_id={quiz.get('_id')}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json().get("questions")[0].get("explanation") == "Yes is the answer!!!"
+    assert response.headers.get("ETag") != etag
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}")
+    etag = response.headers.get("ETag")
+    response = test_client.get(f"/quiz/{quiz.get('_id')}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    _ = test_client.post("/delete_question", json={
+        "_id": question.get("_id")
+    })
+    response = test_client.get(f"/quiz/{quiz.get('_id')}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json().get("questions") == []
+
+    response = test_client.get("/get_public_quizzes")
+    etag = response.headers.get("ETag")
+    response = test_client.get("/get_public_quizzes", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    response = test_client.post("/get_user_quizzes", json={
+        "creator_username": "tester"
+    })
+    user_etag = response.headers.get("ETag")
+    response = test_client.get("/get_user_quizzes?creator_username=tester", headers={"If-None-Match": user_etag})
+    assert response.status_code == 304
+
+    quiz["title"] = "Testing again"
+    _ = test_client.post("/update_quiz", json=quiz)
+    response = test_client.get("/get_public_quizzes", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json().get("public_quizzes")[0].get("title") == "Testing again"
+    response = test_client.get("/get_user_quizzes?creator_username=tester", headers={"If-None-Match": user_etag})
+    assert response.status_code == 200
+
+    # Saving the same details again, or only the questions, leaves the listings as they were
+    response = test_client.get("/get_public_quizzes")
+    etag = response.headers.get("ETag")
+    _ = test_client.post("/update_quiz", json=quiz)
+    response = test_client.post("/sync_quiz", json={
+        "title": quiz["title"],
+        "description": quiz["description"],
+        "is_public": quiz["is_public"],
+        "questions": [{"question": "Who?", "answers": ["Me"], "correct_answer": "Me", "explanation": ""}],
+        "_id": quiz["_id"]
+    })
+    assert response.get_json().get("inserted") == 1
+    response = test_client.get("/get_public_quizzes", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Cleanup
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_ensure_indexes(test_client, monkeypatch):
+    _ = db.index_test.insert_many([{"value": 1}, {"value": 1}])
+    monkeypatch.setattr("backend.app.index_specs", [
+        ("index_test", [("value", ASCENDING)], {"unique": True}), # Can't be built over the duplicates
+        ("index_test", [("other", ASCENDING)], {})
+    ])
+    results = _ensure_indexes()
+    assert [index_name for index_name, _ in results] == ["index_test.value_1", "index_test.other_1"]
+    assert results[0][1] is not None
+    assert results[1][1] is None
+    assert "other_1" in db.index_test.index_information()
+
+    # Cleanup
+    db.index_test.drop()
+
+
+
+
+
+
+def test_memory_cache():
+    cache = MemoryCache(max_bytes=20, ttl=60)
+    cache.set("a", "1234567") # 9 bytes as JSON
+    cache.set("b", "1234567")
+    assert cache.get("a") == "1234567" # Now "b" is the least recently used
+    cache.set("c", "1234567")
+    assert cache.get("b") == None
+    assert cache.get("c") == "1234567"
+    assert cache.stats == {"hits": 2, "misses": 1, "evictions": 1, "entries": 2, "bytes": 18}
+    cache.delete("a")
+    assert cache.get("a") == None
+    cache.set("d", "a" * 30) # Too big to ever fit
+    assert cache.get("d") == None
+
+    cache = MemoryCache(max_bytes=20, ttl=0)
+    cache.set("a", "1")
+    assert cache.get("a") == None
+
+
+
+
+
+
+def test_cached_questions(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    response = test_client.post("/add_question", json={
+        "quiz_id": quiz.get("_id"),
+        "question": "Who?",
+        "answers": ["Yes"],
+        "correct_answer": "Yes",
+        "explanation": "Yes is the right answer."
+    })
+    question = response.get_json().get("question")
+
+    _ = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    })
+    hits = test_client.get("/cache_stats").get_json().get("stats").get("hits")
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    })
+    assert response.get_json().get("questions")[0].get("explanation") == "Yes is the right answer."
+    assert test_client.get("/cache_stats").get_json().get("stats").get("hits") == hits + 1
+
+    question["explanation"] = "Yes is the answer!!!"
+    _ = test_client.post("/update_question", json=question)
+    response = test_client.post("/get_questions", json={
+        "quiz_id": quiz.get("_id")
+    })
+    assert response.get_json().get("questions")[0].get("explanation") == "Yes is the answer!!!"
+
+    # Cleanup
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_pool_stats(test_client):
+    _ = test_client.get("/get_public_quizzes")
+    response = test_client.get("/pool_stats")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert response_object.get("success") == True
+    assert response_object.get("pid") == os.getpid()
+    stats = response_object.get("stats")
+    assert stats.keys() == {"checkouts", "failed_checkouts", "wait_ms_total", "wait_ms_max", "wait_ms_average", "checked_out"}
+    assert stats.get("wait_ms_max") >= stats.get("wait_ms_average") >= 0
+
+
+
+
+
+
+def test_compression(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    _ = test_client.post("/add_question", json={
+        "quiz_id": quiz.get("_id"),
+        "question": "Who?",
+        "answers": ["Yes"],
+        "correct_answer": "Yes",
+        "explanation": "Yes is the right answer. " * 100
+    })
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == "gzip"
+    assert "Accept-Encoding" in response.headers.get("Vary")
+    response_object = json.loads(gzip.decompress(response.get_data()))
+    assert response_object.get("questions")[0].get("explanation") == "Yes is the right answer. " * 100
+    etag = response.headers.get("ETag")
+    assert etag.endswith('-gzip"')
+
+    precompressed_hits = test_client.get("/compression_stats").get_json().get("stats").get("precompressed_hits")
+    response = test_client.get(f"/quiz/{quiz.get('_id')}", headers={"Accept-Encoding": "gzip"})
+    assert json.loads(gzip.decompress(response.get_data())) == response_object
+    stats = test_client.get("/compression_stats").get_json().get("stats")
+    assert stats.get("precompressed_hits") == precompressed_hits + 1
+    assert stats.get("compressed_bytes") < stats.get("raw_bytes")
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}?fields=title&question_fields=question", headers={"Accept-Encoding": "gzip"})
+    assert response.headers.get("Content-Encoding") == None # Too small to be worth it
+
+    response = test_client.get(f"/quiz/{quiz.get('_id')}")
+    assert response.headers.get("Content-Encoding") == None
+    assert response.get_json() == response_object
+
+    # Cleanup
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_get_all_questions(test_client):
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    for answer in ["Yes", "No"]:
+        _ = test_client.post("/add_question", json={
+            "quiz_id": quiz.get("_id"),
+            "question": "Who?",
+            "answers": [answer],
+            "correct_answer": answer,
+            "explanation": ""
+        })
+
+    response = test_client.get(f"/get_all_questions?quiz_id={quiz.get('_id')}")
+    assert response.status_code == 200
+    assert response.is_streamed
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert sorted(question.get("correct_answer") for question in response_object.get("questions")) == ["No", "Yes"]
+    assert len(response_object.get("questions")[0]) == 6
+
+    response = test_client.get(f"/get_all_questions?quiz_id={quiz.get('_id')}&format=ndjson&fields=correct_answer")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    questions = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(questions) == 2
+    assert questions[0].keys() == {"_id", "correct_answer"}
+
+    response = test_client.get(f"/get_all_questions?quiz_id={quiz.get('_id')}&format=ndjson&fields=")
+    questions = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [question.keys() for question in questions] == [{"_id"}, {"_id"}]
+
+    response = test_client.get(f"/get_all_questions?quiz_id={quiz.get('_id')}", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.headers.get("Content-Encoding") == "gzip"
+    assert "Accept-Encoding" in response.headers.get("Vary")
+    assert json.loads(gzip.decompress(response.get_data())) == response_object
+
+    response = test_client.get("/get_all_questions?quiz_id=6569f84b0c8b0f15c7a4f8b3")
+    assert response.get_json() == {"success": True, "questions": []}
+
+    response = test_client.get("/get_all_questions?format=xml")
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Parameter 'format' must be json or ndjson"
+
+    # Cleanup
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_import_export_quizzes(test_client):
+    rows = [
+        {"title": "Imported", "description": "With questions", "creator_username": "importer", "is_public": True, "questions": [
+            {"question": "Who?", "answers": ["Me, myself", "You"], "correct_answer": "Me, myself", "explanation": "Commas survive CSV."},
+            {"question": "What?", "answers": ["This"], "correct_answer": "This", "explanation": ""}
+        ]},
+        {"title": "Empty", "description": "Without questions", "creator_username": "importer", "is_public": False, "questions": []},
+        {"title": "Broken", "description": "", "creator_username": "importer", "is_public": "yes", "questions": []}
+    ]
+    ndjson = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+    response = test_client.post("/import_quizzes", data=ndjson, content_type="application/x-ndjson")
+    assert response.status_code == 201
+    response_object = response.get_json()
+    assert response_object.get("imported_quizzes") == 2
+    assert response_object.get("imported_questions") == 2
+    assert response_object.get("errors") == [
+        {"row": 3, "message": "Field 'is_public' is supposed to be a bool"},
+        {"row": 4, "message": "Row isn't valid JSON"}
+    ]
+
+    response = test_client.get("/export_quizzes?creator_username=importer")
+    assert response.status_code == 200
+    assert response.is_streamed
+    exported = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [quiz.get("title") for quiz in exported] == ["Imported", "Empty"]
+    assert [question.get("answers") for question in exported[0].get("questions")] == [["Me, myself", "You"], ["This"]]
+
+    response = test_client.get("/export_quizzes?creator_username=importer", headers={"Accept-Encoding": "gzip"})
+    assert response.headers.get("Content-Encoding") == "gzip"
+    assert [json.loads(line) for line in gzip.decompress(response.get_data()).splitlines()] == exported
+
+    response = test_client.get("/export_quizzes?creator_username=importer&format=csv")
+    assert response.mimetype == "text/csv"
+    csv_text = response.get_data(as_text=True)
+    assert len(csv_text.splitlines()) == 4 # Header, two questions and the empty quiz
+
+    # Importing an export again into an empty database gives back the same quizzes
+    for quiz in exported:
+        _ = test_client.post("/delete_quiz", json={
+            "_id": quiz.get("_id")
+        })
+    response = test_client.post("/import_quizzes?format=csv", data=csv_text, content_type="text/csv")
+    assert response.get_json() == {"success": True, "imported_quizzes": 2, "imported_questions": 2, "errors": []}
+    response = test_client.get("/export_quizzes?creator_username=importer")
+    assert [json.loads(line) for line in response.get_data(as_text=True).splitlines()] == exported
+
+    response = test_client.post("/import_quizzes?format=csv", data=csv_text, content_type="text/csv")
+    response_object = response.get_json()
+    assert response_object.get("imported_quizzes") == 0
+    assert [error.get("row") for error in response_object.get("errors")] == [2, 4] # Already imported
+
+    response = test_client.post("/import_quizzes?format=xml", data="")
+    assert response.status_code == 400
+    assert response.get_json().get("message") == "Parameter 'format' must be ndjson or csv"
+
+    # Cleanup
+    for quiz in exported:
+        _ = test_client.post("/delete_quiz", json={
+            "_id": quiz.get("_id")
+        })
+
+
+
+
+
+
+def test_add_user(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    assert response.status_code == 201
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    user = response_object.get("user")
+    assert len(user) == 4
+    assert user.get("username") == "tester"
+    assert user.get("email") == "tester@gmail.com"
+    assert user.get("score_history") == []
+    assert isinstance(user.get("_id"), str)
+
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field 'username' already exists"
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": user.get("_id")
+    })
+
+
+
+
+
+
+def test_update_user(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    user = response.get_json().get("user")
+    _id = user.get("_id")
+    
+    user["score_history"] = [{"quiz_name": "Svelte Trivia", "score": 90, "date_taken": ""}] # Leaving the last one blank out of laziness
+    response = test_client.post("/update_user", json=user)
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert response_object.get("message") == "Successful update"
+
+    user["_id"] = ""
+    response = test_client.post("/update_user", json=user)
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field '_id' is invalid"
+
+    user["_id"] = "6569f84b0c8b0f15c7a4f8b3"
+    response = test_client.post("/update_user", json=user)
+    assert response.status_code == 404
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Record not found"
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": _id
+    })
+
+
+
+
+
+
+def test_delete_user(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    user = response.get_json().get("user")
+
+    response = test_client.post("/delete_user", json={
+        "_id": user.get("_id")
+    })
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert response_object.get("message") == "Successful delete"
+
+    response = test_client.post("/delete_user", json={
+        "_id": ""
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field '_id' is invalid"
+
+    response = test_client.post("/delete_user", json={
+        "_id": "6569f84b0c8b0f15c7a4f8b3"
     })
     assert response.status_code == 404
     response_object = response.get_json()
@@ -589,9 +1441,11 @@ def test_get_user(test_client):
     })
     assert response.status_code == 200
     response_object = response.get_json()
-    assert len(response_object) == 2
+    assert len(response_object) == 4
     assert response_object.get("success") == True
     assert len(response_object.get("user")) == 4
+    assert response_object.get("attempts") == []
+    assert response_object.get("next_cursor") == None
 
     response = test_client.post("/get_user", json={
         "username": "impostor"
@@ -605,4 +1459,522 @@ def test_get_user(test_client):
     # Cleanup
     _ = test_client.post("/delete_user", json={
         "_id": user.get("_id")
-    })
\ No newline at end of file
+    })
+
+
+
+
+
+
+def test_record_attempt(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    user = response.get_json().get("user")
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+
+    for score in range(3):
+        response = test_client.post("/record_attempt", json={
+            "username": "tester",
+            "quiz_id": quiz.get("_id"),
+            "score": score,
+            "total": 2
+        })
+        assert response.status_code == 201
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert response_object.get("attempt").get("quiz_name") == "Testing"
+    assert len(response_object.get("attempt")) == 7
+
+    response = test_client.post("/get_user?limit=2", json={
+        "username": "tester"
+    })
+    response_object = response.get_json()
+    assert [attempt.get("score") for attempt in response_object.get("attempts")] == [2, 1]
+    assert response_object.get("next_cursor") != None
+    response = test_client.post(f"/get_user?limit=2&after={response_object.get('next_cursor')}", json={
+        "username": "tester"
+    })
+    response_object = response.get_json()
+    assert [attempt.get("score") for attempt in response_object.get("attempts")] == [0]
+    assert response_object.get("next_cursor") == None
+
+    response = test_client.post("/record_attempt", json={
+        "username": "tester",
+        "quiz_id": quiz.get("_id"),
+        "score": 3,
+        "total": 2
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field 'score' must be between 0 and 'total'"
+
+    response = test_client.post("/record_attempt", json={
+        "username": "impostor",
+        "quiz_id": quiz.get("_id"),
+        "score": 1,
+        "total": 2
+    })
+    assert response.status_code == 404
+    response_object = response.get_json()
+    assert response_object.get("message") == "Record not found"
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": user.get("_id")
+    })
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_migrate_score_history(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": [{"quiz_name": "Svelte Trivia", "score": 0.9, "date_taken": "2025-05-29T14:40:00Z"}, {"quiz_name": "Svelte Trivia", "score": 1, "date_taken": "2025-05-30T14:40:00Z"}]
+    })
+    user = response.get_json().get("user")
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["migrate-score-history"])
+    assert result.output == "Moved 2 attempts from 1 users\n"
+    result = runner.invoke(args=["migrate-score-history"]) # Nothing is left to move
+    assert result.output == "Moved 0 attempts from 0 users\n"
+
+    response = test_client.post("/get_user", json={
+        "username": "tester"
+    })
+    response_object = response.get_json()
+    assert response_object.get("user").get("score_history") == []
+    assert [attempt.get("score") for attempt in response_object.get("attempts")] == [1, 0.9]
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": user.get("_id")
+    })
+
+
+
+
+
+
+def test_quiz_stats(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    user = response.get_json().get("user")
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    question_ids = []
+    for answer in ["Yes", "No"]:
+        response = test_client.post("/add_question", json={
+            "quiz_id": quiz.get("_id"),
+            "question": "Who?",
+            "answers": [answer],
+            "correct_answer": answer,
+            "explanation": ""
+        })
+        question_ids.append(response.get_json().get("question").get("_id"))
+
+    response = test_client.get(f"/quiz_stats/{quiz.get('_id')}")
+    assert response.get_json().get("stats").get("attempts") == 0
+
+    for score in [2, 1]:
+        _ = test_client.post("/record_attempt", json={
+            "username": "tester",
+            "quiz_id": quiz.get("_id"),
+            "score": score,
+            "total": 2,
+            "results": {question_ids[0]: True, question_ids[1]: score == 2}
+        })
+    response = test_client.get(f"/quiz_stats/{quiz.get('_id')}")
+    assert response.status_code == 200
+    stats = response.get_json().get("stats")
+    assert stats.get("attempts") == 2
+    assert stats.get("average_score") == 75
+    assert stats.get("score_stddev") == 25
+    assert stats.get("histogram") == [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    assert stats.get("questions").get(question_ids[1]) == {"correct": 1, "incorrect": 1, "difficulty": 0.5}
+
+    response = test_client.post("/record_attempt", json={
+        "username": "tester",
+        "quiz_id": quiz.get("_id"),
+        "score": 1,
+        "total": 2,
+        "results": {"6569f84b0c8b0f15c7a4f8b3": True}
+    })
+    assert response.status_code == 400
+    assert response.get_json().get("message") == "Field 'results' has unknown question '6569f84b0c8b0f15c7a4f8b3'"
+
+    response = test_client.get("/quiz_stats/invalid")
+    assert response.status_code == 400
+    assert response.get_json().get("message") == "Parameter 'quiz_id' is invalid"
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": user.get("_id")
+    })
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_leaderboard(test_client, monkeypatch):
+    users = []
+    for username in ["tester", "rival"]:
+        response = test_client.post("/add_user", json={
+            "username": username,
+            "email": f"{username}@gmail.com",
+            "score_history": []
+        })
+        users.append(response.get_json().get("user"))
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+
+    for username, score in [("tester", 1), ("rival", 2), ("tester", 2)]:
+        _ = test_client.post("/record_attempt", json={
+            "username": username,
+            "quiz_id": quiz.get("_id"),
+            "score": score,
+            "total": 2
+        })
+    response = test_client.get(f"/leaderboard/{quiz.get('_id')}")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    leaderboard = response_object.get("leaderboard")
+    assert [(entry.get("username"), entry.get("percentage")) for entry in leaderboard] == [("rival", 100), ("tester", 100), ("tester", 50)]
+    assert len(leaderboard[0]) == 8
+
+    response = test_client.get("/leaderboard?limit=1")
+    assert [entry.get("username") for entry in response.get_json().get("leaderboard")] == ["rival"]
+
+    result = app.test_cli_runner().invoke(args=["rebuild-leaderboards"])
+    assert result.output == "Rebuilt 2 leaderboards\n"
+    response = test_client.get(f"/leaderboard/{quiz.get('_id')}")
+    assert response.get_json().get("leaderboard") == leaderboard
+
+    _ = test_client.post("/delete_user", json={
+        "_id": users[1].get("_id")
+    })
+    response = test_client.get("/leaderboard")
+    assert [entry.get("username") for entry in response.get_json().get("leaderboard")] == ["tester", "tester"]
+
+    response = test_client.get("/leaderboard?limit=0")
+    assert response.status_code == 400
+    assert response.get_json().get("message") == "Parameter 'limit' must be between 1 and 100"
+
+    # A full global leaderboard is only written by attempts that beat its last entry
+    monkeypatch.setattr("backend.app.leaderboard_size", 2)
+    for score in [1, 2]:
+        response = test_client.post("/record_attempt", json={
+            "username": "tester",
+            "quiz_id": quiz.get("_id"),
+            "score": score,
+            "total": 4
+        })
+        assert response.status_code == 201
+    response = test_client.get("/leaderboard")
+    assert [(entry.get("percentage"), entry.get("total")) for entry in response.get_json().get("leaderboard")] == [(100, 2), (50, 4)] # 25% didn't make it, 50% of a bigger quiz did
+    response = test_client.post("/record_attempt", json={
+        "username": "tester",
+        "quiz_id": quiz.get("_id"),
+        "score": 4,
+        "total": 4
+    })
+    response = test_client.get("/leaderboard")
+    assert [(entry.get("percentage"), entry.get("total")) for entry in response.get_json().get("leaderboard")] == [(100, 4), (100, 2)]
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": users[0].get("_id")
+    })
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+    _ = app.test_cli_runner().invoke(args=["rebuild-leaderboards"])
+
+
+
+
+
+
+def test_search(test_client):
+    quiz_ids = []
+    for title, description, is_public in [
+        ("Svelte Trivia", "Components and stores", True),
+        ("Frontend Frameworks", "React, Vue and more", True),
+        ("Secret Svelte", "Nobody else can see this", False)
+    ]:
+        response = test_client.post("/create_quiz", json={
+            "title": title,
+            "description": description,
+            "creator_username": "tester",
+            "is_public": is_public
+        })
+        quiz_ids.append(response.get_json().get("quiz").get("_id"))
+    _ = test_client.post("/add_question", json={
+        "quiz_id": quiz_ids[1],
+        "question": "Which framework compiles away, like Svelte?",
+        "answers": ["Svelte"],
+        "correct_answer": "Svelte",
+        "explanation": ""
+    })
+
+    response = test_client.get("/search?q=svelte")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 3
+    assert response_object.get("success") == True
+    assert [result.get("_id") for result in response_object.get("results")] == quiz_ids[:2] # A title match ranks above a question match, and private quizzes are left out
+    assert response_object.get("next_cursor") == None
+
+    response = test_client.get("/search?q=svelte&limit=1")
+    response_object = response.get_json()
+    assert [result.get("_id") for result in response_object.get("results")] == quiz_ids[:1]
+    response = test_client.get(f"/search?q=svelte&limit=1&after={response_object.get('next_cursor')}")
+    assert [result.get("_id") for result in response.get_json().get("results")] == quiz_ids[1:2]
+
+    response = test_client.get("/search")
+    assert response.status_code == 400
+    assert response.get_json().get("message") == "Parameter 'q' is missing"
+
+    # Cleanup
+    for quiz_id in quiz_ids:
+        _ = test_client.post("/delete_quiz", json={
+            "_id": quiz_id
+        })
+
+
+
+
+
+
+def test_autocomplete(test_client):
+    quiz_ids = []
+    for title, is_public in [("Svelte Trivia", True), ("Svelte Stores", True), ("Trivia Night", True), ("Secret Svelte", False)]:
+        response = test_client.post("/create_quiz", json={
+            "title": title,
+            "description": "",
+            "creator_username": "tester",
+            "is_public": is_public
+        })
+        quiz_ids.append(response.get_json().get("quiz").get("_id"))
+
+    response = test_client.get("/autocomplete?q=sv")
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert [result.get("title") for result in response_object.get("results")] == ["Svelte Stores", "Svelte Trivia"]
+
+    response = test_client.get("/autocomplete?q=trivia%20sve")
+    assert [result.get("title") for result in response.get_json().get("results")] == ["Svelte Trivia"]
+
+    response = test_client.get("/autocomplete?q=tri&limit=1")
+    assert [result.get("title") for result in response.get_json().get("results")] == ["Trivia Night"]
+
+    # A rebuild running elsewhere doesn't hold requests up; they get the index as it was
+    response = test_client.post("/create_quiz", json={
+        "title": "Svelte Actions",
+        "description": "",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz_ids.append(response.get_json().get("quiz").get("_id"))
+    autocomplete_index["refreshed_at"] = 0.0
+    with autocomplete_index_lock:
+        response = test_client.get("/autocomplete?q=sv")
+    assert [result.get("title") for result in response.get_json().get("results")] == ["Svelte Stores", "Svelte Trivia"]
+    response = test_client.get("/autocomplete?q=sv")
+    assert [result.get("title") for result in response.get_json().get("results")] == ["Svelte Stores", "Svelte Trivia", "Svelte Actions"]
+
+    # Cleanup
+    for quiz_id in quiz_ids:
+        _ = test_client.post("/delete_quiz", json={
+            "_id": quiz_id
+        })
+
+
+
+
+
+
+def test_grade(test_client):
+    response = test_client.post("/add_user", json={
+        "username": "tester",
+        "email": "tester@gmail.com",
+        "score_history": []
+    })
+    user = response.get_json().get("user")
+    response = test_client.post("/create_quiz", json={
+        "title": "Testing",
+        "description": "Testing is important.",
+        "creator_username": "tester",
+        "is_public": True
+    })
+    quiz = response.get_json().get("quiz")
+    question_ids = []
+    for answer in ["Yes", "No"]:
+        response = test_client.post("/add_question", json={
+            "quiz_id": quiz.get("_id"),
+            "question": "Who?",
+            "answers": ["Yes", "No"],
+            "correct_answer": answer,
+            "explanation": f"{answer} is the right answer."
+        })
+        question_ids.append(response.get_json().get("question").get("_id"))
+
+    response = test_client.post("/grade", json={
+        "quiz_id": quiz.get("_id"),
+        "answers": {question_ids[0]: "Yes", question_ids[1]: "Yes"}
+    })
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 4
+    assert response_object.get("success") == True
+    assert response_object.get("score") == 1
+    assert response_object.get("total") == 2
+    results = {result.get("_id"): result for result in response_object.get("results")}
+    assert results[question_ids[1]] == {"_id": question_ids[1], "correct": False, "correct_answer": "No", "explanation": "No is the right answer."}
+
+    response = test_client.post("/grade", json={
+        "quiz_id": quiz.get("_id"),
+        "answers": {question_ids[1]: "No"},
+        "username": "tester"
+    })
+    response_object = response.get_json()
+    assert response_object.get("score") == 1 # The unanswered question counts as wrong
+    assert response_object.get("attempt_id") != None
+    response = test_client.get(f"/quiz_stats/{quiz.get('_id')}")
+    assert response.get_json().get("stats").get("questions").get(question_ids[0]) == {"correct": 0, "incorrect": 1, "difficulty": 1.0}
+
+    response = test_client.post("/grade", json={
+        "quiz_id": quiz.get("_id"),
+        "answers": {"6569f84b0c8b0f15c7a4f8b3": "Yes"}
+    })
+    assert response.status_code == 400
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Field 'answers' has unknown question '6569f84b0c8b0f15c7a4f8b3'"
+
+    response = test_client.post("/grade", json={
+        "quiz_id": "6569f84b0c8b0f15c7a4f8b3",
+        "answers": {}
+    })
+    assert response.status_code == 404
+    assert response.get_json().get("message") == "Record not found"
+
+    # Cleanup
+    _ = test_client.post("/delete_user", json={
+        "_id": user.get("_id")
+    })
+    _ = test_client.post("/delete_quiz", json={
+        "_id": quiz.get("_id")
+    })
+
+
+
+
+
+
+def test_metrics(test_client):
+    def read_metrics():
+        response = test_client.get("/metrics")
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        return dict(line.rsplit(" ", 1) for line in response.get_data(as_text=True).splitlines() if not line.startswith("#"))
+
+    before = read_metrics()
+    response = test_client.get("/get_public_quizzes")
+    assert response.status_code == 200
+    timings = [timing.split(";")[0] for timing in response.headers.get("Server-Timing").split(", ")]
+    assert timings[0] == "db"
+    assert timings[-1] == "total"
+    assert "serialize" in timings
+    _ = test_client.get("/no_such_route")
+
+    after = read_metrics()
+    for metric in [
+        'quizzle_http_requests_total{route="/get_public_quizzes",status="200"}',
+        'quizzle_http_requests_total{route="unmatched",status="404"}',
+        'quizzle_http_request_duration_seconds_count{route="/get_public_quizzes"}',
+        'quizzle_http_request_duration_seconds_bucket{route="/get_public_quizzes",le="+Inf"}'
+    ]:
+        assert int(after[metric]) == int(before.get(metric, 0)) + 1
+    assert after["quizzle_http_requests_in_flight"] == "1" # The /metrics request itself
+    assert 'quizzle_cache_hits{cache="quiz"}' in after
+
+
+
+
+
+
+@pytest.mark.parametrize("profile_mode, extension", [("sample", "collapsed"), ("cprofile", "prof")])
+def test_profiles(test_client, monkeypatch, tmp_path, profile_mode, extension):
+    monkeypatch.setattr("backend.app.profile_token", "secret")
+    monkeypatch.setattr("backend.app.profile_mode", profile_mode)
+    monkeypatch.setattr("backend.app.profile_dir", str(tmp_path))
+    monkeypatch.setattr("backend.app.profile_max_files", 2)
+
+    response = test_client.get("/get_public_quizzes")
+    assert "X-Profile-Name" not in response.headers
+    names = []
+    for _ in range(3):
+        response = test_client.get("/get_public_quizzes", headers={"X-Profile": "secret"})
+        assert response.status_code == 200
+        names.append(response.headers.get("X-Profile-Name"))
+    assert all(name.endswith(f"get_public_quizzes.{extension}") for name in names)
+
+    response = test_client.get("/profiles", headers={"X-Profile": "secret"})
+    assert response.status_code == 200
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == True
+    assert [profile.get("name") for profile in response_object.get("profiles")] == names[:0:-1] # Only the newest two are kept
+
+    response = test_client.get(f"/profiles/{names[-1]}", headers={"X-Profile": "secret"})
+    assert response.status_code == 200
+    response = test_client.get(f"/profiles/{names[0]}", headers={"X-Profile": "secret"})
+    assert response.status_code == 404
+
+    response = test_client.get("/profiles", headers={"X-Profile": "wrong"})
+    assert response.status_code == 403
+    response_object = response.get_json()
+    assert len(response_object) == 2
+    assert response_object.get("success") == False
+    assert response_object.get("message") == "Header 'X-Profile' is invalid"
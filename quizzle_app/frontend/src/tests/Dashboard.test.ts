@@ -9,8 +9,10 @@ const flushPromises = () => new Promise(resolve => setTimeout(resolve, 0));
 describe('Dashboard', () => {
   beforeEach(() => {
     vi.stubGlobal('fetch', (url: string, opts?: any) => {
+      const { pathname, searchParams } = new URL(url);
+      const after = searchParams.get('after');
       // 1) user_info
-      if (url.endsWith('/user_info')) {
+      if (pathname === '/user_info') {
         return Promise.resolve(
           new Response(
             JSON.stringify({ success: true, user: { email: 'user@example.com' } }),
@@ -18,8 +20,24 @@ describe('Dashboard', () => {
           )
         );
       }
-      // 2) /get_user_quizzes => one quiz
-      if (url.endsWith('/get_user_quizzes')) {
+      // 2) GET /get_user_quizzes?creator_username=... => one quiz, then a second page with an older one
+      const creator = searchParams.get('creator_username');
+      if (pathname === '/get_user_quizzes' && creator === 'user@example.com' && after === 'quiz1') {
+        return Promise.resolve(
+          new Response(
+            JSON.stringify({
+              success: true,
+              public_quizzes: [
+                { _id: 'quiz0', title: 'My Older Quiz', date_created: '2024-12-01T00:00:00Z', terms: [] }
+              ],
+              private_quizzes: [],
+              next_cursor: null
+            }),
+            { status: 200, headers: { 'Content-Type': 'application/json' } }
+          )
+        );
+      }
+      if (pathname === '/get_user_quizzes' && creator === 'user@example.com') {
         return Promise.resolve(
           new Response(
             JSON.stringify({
@@ -32,14 +50,43 @@ describe('Dashboard', () => {
                   date_created: '2025-01-01T00:00:00Z',
                   terms: []
                 }
-              ]
+              ],
+              next_cursor: 'quiz1'
+            }),
+            { status: 200, headers: { 'Content-Type': 'application/json' } }
+          )
+        );
+      }
+      // 3) /get_public_quizzes => one other quiz, then a page with only my own quiz, then one more other quiz
+      if (pathname === '/get_public_quizzes' && after === 'quiz2') {
+        return Promise.resolve(
+          new Response(
+            JSON.stringify({
+              success: true,
+              public_quizzes: [
+                { _id: 'quiz4', title: 'My Public Quiz', creator_username: 'user@example.com', date_created: '2025-01-15T00:00:00Z', terms: [] }
+              ],
+              next_cursor: 'quiz4'
+            }),
+            { status: 200, headers: { 'Content-Type': 'application/json' } }
+          )
+        );
+      }
+      if (pathname === '/get_public_quizzes' && after === 'quiz4') {
+        return Promise.resolve(
+          new Response(
+            JSON.stringify({
+              success: true,
+              public_quizzes: [
+                { _id: 'quiz3', title: 'Older Other Quiz', creator_username: 'bob', date_created: '2025-01-01T00:00:00Z', terms: [] }
+              ],
+              next_cursor: null
             }),
             { status: 200, headers: { 'Content-Type': 'application/json' } }
           )
         );
       }
-      // 3) /get_public_quizzes => one other quiz
-      if (url.endsWith('/get_public_quizzes')) {
+      if (pathname === '/get_public_quizzes') {
         return Promise.resolve(
           new Response(
             JSON.stringify({
@@ -52,7 +99,8 @@ describe('Dashboard', () => {
                   date_created: '2025-02-02T00:00:00Z',
                   terms: []
                 }
-              ]
+              ],
+              next_cursor: 'quiz2'
             }),
             { status: 200, headers: { 'Content-Type': 'application/json' } }
           )
@@ -106,4 +154,33 @@ describe('Dashboard', () => {
     expect(await screen.findByRole('heading', { level: 3, name: 'Other Quiz' })).toBeInTheDocument();
     expect(screen.getByText('by alice')).toBeInTheDocument();
   });
+
+  it('loads the next page of my quizzes with "Load more"', async () => {
+    render(Dashboard);
+    await flushPromises();
+
+    await fireEvent.click(screen.getByText('My quizzes'));
+    expect(await screen.findByRole('heading', { level: 3, name: 'My Quiz' })).toBeInTheDocument();
+
+    await fireEvent.click(screen.getByRole('button', { name: 'Load more' }));
+
+    expect(await screen.findByRole('heading', { level: 3, name: 'My Older Quiz' })).toBeInTheDocument();
+    expect(screen.getAllByRole('heading', { level: 3 })).toHaveLength(2);
+    // That was the last page
+    expect(screen.queryByRole('button', { name: 'Load more' })).not.toBeInTheDocument();
+  });
+
+  it("skips past pages holding only my own quizzes when loading more of others' quizzes", async () => {
+    render(Dashboard);
+    await flushPromises();
+
+    await fireEvent.click(screen.getByText("Study with others' quizzes"));
+    expect(await screen.findByRole('heading', { level: 3, name: 'Other Quiz' })).toBeInTheDocument();
+
+    await fireEvent.click(screen.getByRole('button', { name: 'Load more' }));
+
+    expect(await screen.findByRole('heading', { level: 3, name: 'Older Other Quiz' })).toBeInTheDocument();
+    expect(screen.queryByRole('heading', { level: 3, name: 'My Public Quiz' })).not.toBeInTheDocument();
+    expect(screen.queryByRole('button', { name: 'Load more' })).not.toBeInTheDocument();
+  });
 });
@@ -6,7 +6,7 @@ describe('EditQuiz', () => {
   const dummyId = 'test123';
 
   beforeEach(() => {
-    // stub fetch for user_info, get_user_quizzes, get_questions…
+    // stub fetch for user_info and the quiz bundle…
     interface UserInfoResponse {
       success: boolean;
       user: {
@@ -22,14 +22,9 @@ describe('EditQuiz', () => {
       date_created: string;
     }
 
-    interface GetUserQuizzesResponse {
-      success: boolean;
-      public_quizzes: Quiz[];
-      private_quizzes: Quiz[];
-    }
-
-    interface GetQuestionsResponse {
+    interface GetQuizBundleResponse {
       success: boolean;
+      quiz: Quiz;
       questions: any[]; // Replace 'any' with a specific Question interface if available
     }
 
@@ -39,24 +34,20 @@ describe('EditQuiz', () => {
         const body: UserInfoResponse = { success: true, user: { email: 'a@b' } };
         return Promise.resolve(new Response(JSON.stringify(body), { status: 200 }));
       }
-      if (url.endsWith('/get_user_quizzes')) {
-        const body: GetUserQuizzesResponse = {
+      if (url.includes(`/quiz/${dummyId}`)) {
+        const body: GetQuizBundleResponse = {
           success: true,
-          public_quizzes: [],
-          private_quizzes: [{
+          quiz: {
             _id: dummyId,
             title: '',
             is_public: true,
             description: '',
             date_created: ''
-          }]
+          },
+          questions: []
         };
         return Promise.resolve(new Response(JSON.stringify(body), { status: 200 }));
       }
-      if (url.endsWith('/get_questions')) {
-        const body: GetQuestionsResponse = { success: true, questions: [] };
-        return Promise.resolve(new Response(JSON.stringify(body), { status: 200 }));
-      }
       // fallback
       return Promise.resolve(new Response(null, { status: 404 }));
     });
@@ -14,8 +14,9 @@ describe('QuizDetail', () => {
 
   beforeEach(() => {
     fetchMock = vi.fn((url: string, opts: any) => {
-      // 1) QuizDetail calls POST /get_questions
-      if (url.endsWith('/get_questions')) {
+      const { pathname, searchParams } = new URL(url);
+      // 1) QuizDetail calls GET /get_questions?quiz_id=...
+      if (pathname === '/get_questions' && searchParams.get('quiz_id') === dummyQuiz._id) {
         return Promise.resolve(
           new Response(
             JSON.stringify({ success: true, questions: dummyQuestions }),
@@ -12,15 +12,15 @@ describe('QuizTaking', () => {
 
   beforeEach(() => {
     fetchMock = vi.fn((url: string) => {
-      if (url.endsWith('/get_all_questions')) {
+      if (url.endsWith('/get_quiz_options')) {
         return Promise.resolve(new Response(
-          JSON.stringify({ success: true, questions: dummyQuestions }),
+          JSON.stringify({ success: true, questions: [{ _id: 'q1', question: dummyQuestions[0].question, options: ['4', '3', 'Sac'] }] }),
           { status: 200, headers: { 'Content-Type': 'application/json' } }
         ));
       }
-      if (url.endsWith('/get_questions')) {
+      if (url.endsWith('/grade')) {
         return Promise.resolve(new Response(
-          JSON.stringify({ success: true, questions: [dummyQuestions[0]] }),
+          JSON.stringify({ success: true, score: 1, total: 1, results: [{ _id: 'q1', correct: true, correct_answer: '4', explanation: 'Basic math' }] }),
           { status: 200, headers: { 'Content-Type': 'application/json' } }
         ));
       }
@@ -70,8 +70,11 @@ describe('QuizTaking', () => {
     const finishBtn = screen.getByRole('button', { name: /Finish Quiz/i });
     await fireEvent.click(finishBtn);
 
-    // Wait for the results heading, then click "Back to Quiz Details"
+    // Wait for the graded results, then click "Back to Quiz Details"
     expect(await screen.findByText('Quiz Complete!')).toBeInTheDocument();
+    expect(screen.getByText('1/1')).toBeInTheDocument();
+    const gradeCall = fetchMock.mock.calls.find(([url]: [string]) => url.endsWith('/grade'));
+    expect(JSON.parse(gradeCall[1].body).answers).toEqual({ q1: '4' });
     const backBtn = await screen.findByRole('button', { name: /Back to Quiz Details/i });
     await fireEvent.click(backBtn);
 